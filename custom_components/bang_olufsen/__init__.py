@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from aiohttp import (
@@ -13,6 +13,7 @@ from aiohttp import (
     WSMessageTypeError,
 )
 from mozart_api.exceptions import ApiException
+from mozart_api.models import PairedRemote
 from mozart_api.mozart_client import MozartClient
 
 from homeassistant.config_entries import ConfigEntry
@@ -27,6 +28,9 @@ from .halo import Halo
 from .util import get_remotes, is_halo, is_mozart
 from .websocket import HaloWebsocket, MozartWebsocket
 
+if TYPE_CHECKING:
+    from .event import BangOlufsenButtonEvent, BangOlufsenRemoteKeyEvent
+
 MOZART_PLATFORMS = [
     Platform.BINARY_SENSOR,
     Platform.EVENT,
@@ -50,6 +54,15 @@ class MozartData:
     websocket: MozartWebsocket
     client: MozartClient
     platforms_initialized: int = 0
+    # Set when all platforms have been initialized
+    platforms_ready: asyncio.Event = field(default_factory=asyncio.Event)
+    # Paired Beoremote One remotes, fetched once during setup and shared by the platforms
+    remotes: list[PairedRemote] = field(default_factory=list)
+    # Event entities that WebSocket button notifications are delivered to directly
+    button_entities: dict[str, BangOlufsenButtonEvent] = field(default_factory=dict)
+    remote_key_entities: dict[str, list[BangOlufsenRemoteKeyEvent]] = field(
+        default_factory=dict
+    )
 
 
 @dataclass
@@ -59,6 +72,8 @@ class HaloData:
     websocket: HaloWebsocket
     client: Halo
     platforms_initialized: int = 0
+    # Set when all platforms have been initialized
+    platforms_ready: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 type MozartConfigEntry = ConfigEntry[MozartData]
@@ -69,19 +84,18 @@ def set_platform_initialized(data: MozartData | HaloData) -> None:
     """Increment platforms_initialized to indicate that a platform has been initialized."""
     data.platforms_initialized += 1
 
+    platforms = HALO_PLATFORMS if isinstance(data, HaloData) else MOZART_PLATFORMS
+
+    if data.platforms_initialized == len(platforms):
+        data.platforms_ready.set()
+
 
 async def _start_websocket_listener(
     config_entry: HaloConfigEntry | MozartConfigEntry,
-    platforms: list[Platform],
 ) -> None:
     """Start WebSocket listener when all platforms have been initialized."""
 
-    while True:
-        # Check if all platforms have been initialized and start WebSocket listener
-        if len(platforms) == config_entry.runtime_data.platforms_initialized:
-            break
-
-        await asyncio.sleep(0)
+    await config_entry.runtime_data.platforms_ready.wait()
 
     if is_mozart(config_entry):
         if TYPE_CHECKING:
@@ -95,12 +109,12 @@ async def _start_websocket_listener(
         await config_entry.runtime_data.client.connect_events(reconnect=True)
 
 
-async def _handle_remote_devices(
-    hass: HomeAssistant, config_entry: ConfigEntry, client: MozartClient
+def _handle_remote_devices(
+    hass: HomeAssistant, config_entry: ConfigEntry, remotes: list[PairedRemote]
 ) -> None:
     """Add or remove paired Beoremote One devices."""
     # Check for connected Beoremote One
-    if remotes := await get_remotes(client):
+    if remotes:
         for remote in remotes:
             if TYPE_CHECKING:
                 assert remote.serial_number
@@ -127,10 +141,11 @@ async def _handle_remote_devices(
     devices = device_registry.devices.get_devices_for_config_entry_id(
         config_entry.entry_id
     )
+    remote_serial_numbers = {remote.serial_number for remote in remotes}
     for device in devices:
         if (
             device.model == BangOlufsenModel.BEOREMOTE_ONE
-            and device.serial_number not in [remote.serial_number for remote in remotes]
+            and device.serial_number not in remote_serial_numbers
         ):
             device_registry.async_remove_device(device.id)
 
@@ -185,18 +200,21 @@ async def _setup_mozart(hass: HomeAssistant, config_entry: MozartConfigEntry) ->
     # Initialize coordinator
     websocket = MozartWebsocket(hass, config_entry, client)
 
+    # Get paired Beoremote One remotes once for all platforms
+    remotes = await get_remotes(client)
+
     # Add the coordinator and API client
-    config_entry.runtime_data = MozartData(websocket, client)
+    config_entry.runtime_data = MozartData(websocket, client, remotes=remotes)
 
     # Handle paired Beoremote One devices
-    await _handle_remote_devices(hass, config_entry, client)
+    _handle_remote_devices(hass, config_entry, remotes)
 
     await hass.config_entries.async_forward_entry_setups(config_entry, MOZART_PLATFORMS)
 
     # Start WebSocket connection when all entities have been initialized
     config_entry.async_create_background_task(
         hass,
-        _start_websocket_listener(config_entry, MOZART_PLATFORMS),
+        _start_websocket_listener(config_entry),
         f"{DOMAIN}-{config_entry.unique_id}-mozart-websocket_starter",
     )
 
@@ -227,7 +245,7 @@ async def _setup_halo(hass: HomeAssistant, config_entry: HaloConfigEntry) -> boo
     # Start WebSocket connection when all entities have been initialized
     config_entry.async_create_background_task(
         hass,
-        _start_websocket_listener(config_entry, HALO_PLATFORMS),
+        _start_websocket_listener(config_entry),
         f"{DOMAIN}-{config_entry.unique_id}-halo-websocket_starter",
     )
 
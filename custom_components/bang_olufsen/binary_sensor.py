@@ -14,7 +14,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HaloConfigEntry, MozartConfigEntry, set_platform_initialized
-from .const import CONNECTION_STATUS, WebsocketNotification
+from .const import WebsocketNotification
 from .entity import HaloEntity, MozartEntity
 from .halo import PowerEvent, PowerEventState
 from .util import is_halo
@@ -85,14 +85,14 @@ class MozartBinarySensorBatteryCharging(MozartBinarySensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.BATTERY}",
+                self._signals[WebsocketNotification.BATTERY],
                 self._update_battery_charging,
             )
         )
@@ -138,14 +138,14 @@ class HaloBinarySensorBatteryCharging(HaloBinarySensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.HALO_POWER}",
+                self._signals[WebsocketNotification.HALO_POWER],
                 self._update_battery_charging,
             )
         )
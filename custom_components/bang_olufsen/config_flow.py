@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from ipaddress import AddressValueError, IPv4Address
+import socket
 from typing import Any, TypedDict
 
 from aiohttp.client_exceptions import ClientConnectorError
@@ -54,7 +54,7 @@ from .const import (
     HALO_BUTTON_ICONS,
     HALO_TEXT_LENGTH,
     HALO_TITLE_LENGTH,
-    MOZART_MODELS,
+    MOZART_MODELS_ORDERED,
     ZEROCONF_HALO,
     ZEROCONF_MOZART,
     BangOlufsenModel,
@@ -94,13 +94,72 @@ class BangOlufsenEntryData(TypedDict, total=False):
     entity_map: dict[str, str]
 
 
-# Map exception types to strings
-_exception_map = {
-    ApiException: "api_exception",
-    ClientConnectorError: "client_connector_error",
-    TimeoutError: "timeout_error",
-    AddressValueError: "invalid_ip",
-}
+# Map exception types to strings. Checked with isinstance to handle subclasses
+_EXCEPTION_REASONS: tuple[tuple[type[Exception], str], ...] = (
+    (ApiException, "api_exception"),
+    (ClientConnectorError, "client_connector_error"),
+    (TimeoutError, "timeout_error"),
+)
+
+
+def _is_ipv4_address(host: str) -> bool:
+    """Check if host is a valid IPv4 address."""
+    try:
+        socket.inet_pton(socket.AF_INET, host)
+    # inet_pton raises ValueError instead of OSError for strings with embedded NUL
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def _get_exception_reason(error: Exception) -> str:
+    """Get the translated error reason for an exception."""
+    return next(
+        reason
+        for exception_type, reason in _EXCEPTION_REASONS
+        if isinstance(error, exception_type)
+    )
+
+
+# Static form schemas, built once at import
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_HOST): str,
+        vol.Required(CONF_MODEL, default=DEFAULT_MODEL): SelectSelector(
+            SelectSelectorConfig(options=list(MOZART_MODELS_ORDERED))
+        ),
+    }
+)
+
+# TO DO filter unsupported entities
+_ADD_PAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PAGE_NAME): str,
+        vol.Required(CONF_ENTITIES): EntitySelector(
+            EntitySelectorConfig(multiple=True)
+        ),
+    }
+)
+
+_CREATE_BUTTONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TITLE): vol.All(
+            str,
+            vol.Length(max=HALO_TITLE_LENGTH),
+        ),
+        vol.Optional(CONF_SUBTITLE, default=""): vol.All(
+            str,
+            vol.Length(max=HALO_TITLE_LENGTH),
+        ),
+        vol.Exclusive(CONF_ICON, "content", "Error"): SelectSelector(
+            SelectSelectorConfig(options=HALO_BUTTON_ICONS)
+        ),
+        vol.Exclusive(CONF_TEXT, "content", "Error"): vol.All(
+            str,
+            vol.Length(max=HALO_TEXT_LENGTH),
+        ),
+    },
+)
 
 
 class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -123,26 +182,15 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_HOST): str,
-                vol.Required(CONF_MODEL, default=DEFAULT_MODEL): SelectSelector(
-                    SelectSelectorConfig(options=MOZART_MODELS)
-                ),
-            }
-        )
-
         if user_input is not None:
             self._host = user_input[CONF_HOST]
             self._model = user_input[CONF_MODEL]
 
-            try:
-                IPv4Address(self._host)
-            except AddressValueError as error:
+            if not _is_ipv4_address(self._host):
                 return self.async_show_form(
                     step_id="user",
-                    data_schema=data_schema,
-                    errors={"base": _exception_map[type(error)]},
+                    data_schema=_USER_SCHEMA,
+                    errors={"base": "invalid_ip"},
                 )
 
             self._mozart_client = MozartClient(
@@ -162,8 +210,8 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                 ) as error:
                     return self.async_show_form(
                         step_id="user",
-                        data_schema=data_schema,
-                        errors={"base": _exception_map[type(error)]},
+                        data_schema=_USER_SCHEMA,
+                        errors={"base": _get_exception_reason(error)},
                     )
 
             self._beolink_jid = beolink_self.jid
@@ -176,7 +224,7 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
         )
 
     async def async_step_zeroconf(
@@ -187,9 +235,7 @@ class BangOlufsenConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         # Ensure that an IPv4 address is received
         self._host = discovery_info.host
 
-        try:
-            IPv4Address(self._host)
-        except AddressValueError:
+        if not _is_ipv4_address(self._host):
             return self.async_abort(reason="ipv6_address")
 
         # Default to Mozart products
@@ -356,19 +402,9 @@ class HaloOptionsFlowHandler(OptionsFlow):
 
             return await self.async_step_create_buttons()
 
-        # TO DO filter unsupported entities
-        options_schema = vol.Schema(
-            {
-                vol.Required(CONF_PAGE_NAME): str,
-                vol.Required(CONF_ENTITIES): EntitySelector(
-                    EntitySelectorConfig(multiple=True)
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="add_page",
-            data_schema=options_schema,
+            data_schema=_ADD_PAGE_SCHEMA,
         )
 
     async def async_step_create_buttons(
@@ -408,25 +444,7 @@ class HaloOptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="create_buttons",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_TITLE): vol.All(
-                        str,
-                        vol.Length(max=HALO_TITLE_LENGTH),
-                    ),
-                    vol.Optional(CONF_SUBTITLE, default=""): vol.All(
-                        str,
-                        vol.Length(max=HALO_TITLE_LENGTH),
-                    ),
-                    vol.Exclusive(CONF_ICON, "content", "Error"): SelectSelector(
-                        SelectSelectorConfig(options=HALO_BUTTON_ICONS)
-                    ),
-                    vol.Exclusive(CONF_TEXT, "content", "Error"): vol.All(
-                        str,
-                        vol.Length(max=HALO_TEXT_LENGTH),
-                    ),
-                },
-            ),
+            data_schema=_CREATE_BUTTONS_SCHEMA,
             description_placeholders={
                 "entity": self._entity_ids[-1],
                 "page": self._page.title,
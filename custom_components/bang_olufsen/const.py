@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from functools import cache
 from typing import Final
 
 from mozart_api.models import Source, SourceArray, SourceTypeEnum
@@ -26,6 +27,16 @@ class BangOlufsenSource:
     USB_IN: Final[Source] = Source(name="USB", id="usbIn")
 
 
+# Source ids where playback progress is not available
+NO_PROGRESS_SOURCE_IDS: Final[frozenset[str | None]] = frozenset(
+    (BangOlufsenSource.LINE_IN.id, BangOlufsenSource.SPDIF.id)
+)
+# Source ids that can be used as a default when no source is active
+DEFAULT_SOURCE_IDS: Final[frozenset[str | None]] = frozenset(
+    (BangOlufsenSource.LINE_IN.id, BangOlufsenSource.USB_IN.id)
+)
+
+
 BANG_OLUFSEN_STATES: dict[str, MediaPlayerState] = {
     # Dict used for translating device states to Home Assistant states.
     "started": MediaPlayerState.PLAYING,
@@ -127,6 +138,22 @@ class WebsocketNotification(StrEnum):
     HALO_BUTTON = "halo_button"
 
 
+# Notifications that trigger a Beolink update
+BEOLINK_NOTIFICATIONS: Final[frozenset[WebsocketNotification]] = frozenset(
+    (
+        WebsocketNotification.BEOLINK_PEERS,
+        WebsocketNotification.BEOLINK_LISTENERS,
+        WebsocketNotification.BEOLINK_AVAILABLE_LISTENERS,
+    )
+)
+PROXIMITY_NOTIFICATIONS: Final[frozenset[WebsocketNotification]] = frozenset(
+    (
+        WebsocketNotification.PROXIMITY_PRESENCE_DETECTED,
+        WebsocketNotification.PROXIMITY_PRESENCE_NOT_DETECTED,
+    )
+)
+
+
 DOMAIN: Final[str] = "bang_olufsen"
 
 # Default values for configuration.
@@ -151,18 +178,22 @@ HALO_PAGE_LENGTH: Final = 35
 HALO_TEXT_LENGTH: Final = 6
 
 # The names of compatible button icons for the Beoremote Halo
-HALO_BUTTON_ICONS: list[str] = [icon.name for icon in Icons]
+HALO_BUTTON_ICONS: Final[list[str]] = [icon.name for icon in Icons]
 
 # Timeout for sending wheel events in seconds
 HALO_WHEEL_TIMEOUT: Final = 0.125
 
 # Mozart models
-MOZART_MODELS: Final[list[BangOlufsenModel]] = [
+# Mozart models in display order
+MOZART_MODELS_ORDERED: Final[tuple[BangOlufsenModel, ...]] = tuple(
     model
     for model in BangOlufsenModel
     if model.value
     not in (BangOlufsenModel.BEOREMOTE_HALO, BangOlufsenModel.BEOREMOTE_ONE)
-]
+)
+
+# Mozart models for membership checks
+MOZART_MODELS: Final[frozenset[BangOlufsenModel]] = frozenset(MOZART_MODELS_ORDERED)
 
 MANUFACTURER: Final[str] = "Bang & Olufsen"
 
@@ -179,7 +210,8 @@ ATTR_FRIENDLY_NAME: Final[str] = "fn"
 # Power states.
 BANG_OLUFSEN_ON: Final[str] = "on"
 
-VALID_MEDIA_TYPES: Final[tuple[str, ...]] = (
+# Valid media types in display order
+VALID_MEDIA_TYPES_ORDERED: Final[tuple[str, ...]] = (
     BangOlufsenMediaType.DEEZER,
     BangOlufsenMediaType.FAVOURITE,
     BangOlufsenMediaType.OVERLAY_TTS,
@@ -191,75 +223,82 @@ VALID_MEDIA_TYPES: Final[tuple[str, ...]] = (
     MediaType.CHANNEL,
 )
 
+# Valid media types for membership checks
+VALID_MEDIA_TYPES: Final[frozenset[str]] = frozenset(VALID_MEDIA_TYPES_ORDERED)
+
+
 # Fallback sources to use in case of API failure.
-FALLBACK_SOURCES: Final[SourceArray] = SourceArray(
-    items=[
-        Source(
-            id="uriStreamer",
-            is_enabled=True,
-            is_playable=True,
-            name="Audio Streamer",
-            type=SourceTypeEnum(value="uriStreamer"),
-            is_seekable=False,
-        ),
-        Source(
-            id="bluetooth",
-            is_enabled=True,
-            is_playable=True,
-            name="Bluetooth",
-            type=SourceTypeEnum(value="bluetooth"),
-            is_seekable=False,
-        ),
-        Source(
-            id="spotify",
-            is_enabled=True,
-            is_playable=True,
-            name="Spotify Connect",
-            type=SourceTypeEnum(value="spotify"),
-            is_seekable=True,
-        ),
-        Source(
-            id="lineIn",
-            is_enabled=True,
-            is_playable=True,
-            name="Line-In",
-            type=SourceTypeEnum(value="lineIn"),
-            is_seekable=False,
-        ),
-        Source(
-            id="spdif",
-            is_enabled=True,
-            is_playable=True,
-            name="Optical",
-            type=SourceTypeEnum(value="spdif"),
-            is_seekable=False,
-        ),
-        Source(
-            id="netRadio",
-            is_enabled=True,
-            is_playable=True,
-            name="B&O Radio",
-            type=SourceTypeEnum(value="netRadio"),
-            is_seekable=False,
-        ),
-        Source(
-            id="deezer",
-            is_enabled=True,
-            is_playable=True,
-            name="Deezer",
-            type=SourceTypeEnum(value="deezer"),
-            is_seekable=True,
-        ),
-        Source(
-            id="tidalConnect",
-            is_enabled=True,
-            is_playable=True,
-            name="Tidal Connect",
-            type=SourceTypeEnum(value="tidalConnect"),
-            is_seekable=True,
-        ),
-    ]
-)
+@cache
+def get_fallback_sources() -> SourceArray:
+    """Get the fallback sources. Only built if the sources can't be retrieved from the device."""
+    return SourceArray(
+        items=[
+            Source(
+                id="uriStreamer",
+                is_enabled=True,
+                is_playable=True,
+                name="Audio Streamer",
+                type=SourceTypeEnum(value="uriStreamer"),
+                is_seekable=False,
+            ),
+            Source(
+                id="bluetooth",
+                is_enabled=True,
+                is_playable=True,
+                name="Bluetooth",
+                type=SourceTypeEnum(value="bluetooth"),
+                is_seekable=False,
+            ),
+            Source(
+                id="spotify",
+                is_enabled=True,
+                is_playable=True,
+                name="Spotify Connect",
+                type=SourceTypeEnum(value="spotify"),
+                is_seekable=True,
+            ),
+            Source(
+                id="lineIn",
+                is_enabled=True,
+                is_playable=True,
+                name="Line-In",
+                type=SourceTypeEnum(value="lineIn"),
+                is_seekable=False,
+            ),
+            Source(
+                id="spdif",
+                is_enabled=True,
+                is_playable=True,
+                name="Optical",
+                type=SourceTypeEnum(value="spdif"),
+                is_seekable=False,
+            ),
+            Source(
+                id="netRadio",
+                is_enabled=True,
+                is_playable=True,
+                name="B&O Radio",
+                type=SourceTypeEnum(value="netRadio"),
+                is_seekable=False,
+            ),
+            Source(
+                id="deezer",
+                is_enabled=True,
+                is_playable=True,
+                name="Deezer",
+                type=SourceTypeEnum(value="deezer"),
+                is_seekable=True,
+            ),
+            Source(
+                id="tidalConnect",
+                is_enabled=True,
+                is_playable=True,
+                name="Tidal Connect",
+                type=SourceTypeEnum(value="tidalConnect"),
+                is_seekable=True,
+            ),
+        ]
+    )
 
 
 # Map for storing compatibility of devices.
@@ -268,26 +307,30 @@ MODEL_SUPPORT_PROXIMITY: Final[str] = "proximity_sensor"
 MODEL_SUPPORT_HOME_CONTROL: Final[str] = "home_control"
 MODEL_SUPPORT_DEVICE_BUTTONS: Final[str] = "device_buttons"
 
-MODEL_SUPPORT_MAP = {
-    MODEL_SUPPORT_PROXIMITY: (
-        BangOlufsenModel.BEOLAB_8,
-        BangOlufsenModel.BEOLAB_28,
-        BangOlufsenModel.BEOSOUND_2,
-        BangOlufsenModel.BEOSOUND_BALANCE,
-        BangOlufsenModel.BEOSOUND_LEVEL,
-        BangOlufsenModel.BEOSOUND_THEATRE,
+MODEL_SUPPORT_MAP: Final[dict[str, frozenset[BangOlufsenModel]]] = {
+    MODEL_SUPPORT_PROXIMITY: frozenset(
+        (
+            BangOlufsenModel.BEOLAB_8,
+            BangOlufsenModel.BEOLAB_28,
+            BangOlufsenModel.BEOSOUND_2,
+            BangOlufsenModel.BEOSOUND_BALANCE,
+            BangOlufsenModel.BEOSOUND_LEVEL,
+            BangOlufsenModel.BEOSOUND_THEATRE,
+        )
     ),
-    MODEL_SUPPORT_HOME_CONTROL: (BangOlufsenModel.BEOSOUND_THEATRE,),
-    MODEL_SUPPORT_DEVICE_BUTTONS: (
-        BangOlufsenModel.BEOLAB_8,
-        BangOlufsenModel.BEOLAB_28,
-        BangOlufsenModel.BEOSOUND_2,
-        BangOlufsenModel.BEOSOUND_A5,
-        BangOlufsenModel.BEOSOUND_A9,
-        BangOlufsenModel.BEOSOUND_BALANCE,
-        BangOlufsenModel.BEOSOUND_EMERGE,
-        BangOlufsenModel.BEOSOUND_LEVEL,
-        BangOlufsenModel.BEOSOUND_THEATRE,
+    MODEL_SUPPORT_HOME_CONTROL: frozenset((BangOlufsenModel.BEOSOUND_THEATRE,)),
+    MODEL_SUPPORT_DEVICE_BUTTONS: frozenset(
+        (
+            BangOlufsenModel.BEOLAB_8,
+            BangOlufsenModel.BEOLAB_28,
+            BangOlufsenModel.BEOSOUND_2,
+            BangOlufsenModel.BEOSOUND_A5,
+            BangOlufsenModel.BEOSOUND_A9,
+            BangOlufsenModel.BEOSOUND_BALANCE,
+            BangOlufsenModel.BEOSOUND_EMERGE,
+            BangOlufsenModel.BEOSOUND_LEVEL,
+            BangOlufsenModel.BEOSOUND_THEATRE,
+        )
     ),
 }
 
@@ -314,7 +357,7 @@ EVENT_TRANSLATION_MAP: dict[str, str] = {
 
 CONNECTION_STATUS: Final[str] = "CONNECTION_STATUS"
 
-DEVICE_BUTTONS: Final[list[str]] = [
+DEVICE_BUTTONS: Final[tuple[str, ...]] = (
     "Bluetooth",
     "Microphone",
     "Next",
@@ -325,7 +368,7 @@ DEVICE_BUTTONS: Final[list[str]] = [
     "Preset4",
     "Previous",
     "Volume",
-]
+)
 
 
 DEVICE_BUTTON_EVENTS: Final[list[str]] = [
@@ -399,6 +442,20 @@ BEO_REMOTE_CONTROL_KEYS: Final[tuple[str, ...]] = (
 )
 
 
+# Fully qualified "submenu/key" paths for all Beoremote One key entities
+BEO_REMOTE_KEY_PATHS: Final[tuple[str, ...]] = (
+    *(f"{BEO_REMOTE_SUBMENU_LIGHT}/{key_type}" for key_type in BEO_REMOTE_KEYS),
+    *(
+        f"{BEO_REMOTE_SUBMENU_CONTROL}/{key_type}"
+        for key_type in (*BEO_REMOTE_KEYS, *BEO_REMOTE_CONTROL_KEYS)
+    ),
+)
+
+# Home Assistant compatible translation keys for the Beoremote One key paths
+BEO_REMOTE_KEY_TRANSLATION_KEYS: Final[dict[str, str]] = {
+    key_path: key_path.lower().replace("/", "_") for key_path in BEO_REMOTE_KEY_PATHS
+}
+
 BEO_REMOTE_KEY_EVENTS: Final[list[str]] = ["key_press", "key_release"]
 
 PROXIMITY_EVENTS: Final[list[str]] = [
@@ -452,12 +509,14 @@ NONE_PARAMETERS: Final[tuple[str, str, str, str, str, str, str, str, None]] = (
     None,
 )
 
-# Tuple of accepted commands for input validation
-ACCEPTED_COMMANDS: Final[tuple[tuple[str]]] = (
-    FLOAT_PARAMETERS[:-1]  # type: ignore[assignment]
-    + BOOL_PARAMETERS[:-1]
-    + STR_PARAMETERS[:-1]
-    + NONE_PARAMETERS[:-1]
+# Set of accepted commands for input validation
+ACCEPTED_COMMANDS: Final[frozenset[str]] = frozenset(
+    (
+        *FLOAT_PARAMETERS[:-1],
+        *BOOL_PARAMETERS[:-1],
+        *STR_PARAMETERS[:-1],
+        *NONE_PARAMETERS[:-1],
+    )
 )
 
 # Tuple of all commands and their types for executing commands.
@@ -472,3 +531,10 @@ ACCEPTED_COMMANDS_LISTS: tuple[
     STR_PARAMETERS,
     NONE_PARAMETERS,
 )
+
+# Dict of all commands and their parameter types for executing commands.
+ACCEPTED_COMMANDS_TYPES: Final[dict[str, type[float | bool | str] | None]] = {
+    command: command_list[-1]  # type: ignore[misc]
+    for command_list in ACCEPTED_COMMANDS_LISTS
+    for command in command_list[:-1]
+}
@@ -32,8 +32,9 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import Entity
 
-from .const import DOMAIN
+from .const import CONNECTION_STATUS, DOMAIN
 from .halo import Halo
+from .util import get_signals
 
 
 class BangOlufsenBase:
@@ -49,6 +50,11 @@ class BangOlufsenBase:
         self._host: str = self.entry.data[CONF_HOST]
         self._unique_id: str = cast(str, self.entry.unique_id)
 
+        # Built once as the signal is used by every connection state dispatch.
+        self._connection_signal = f"{self._unique_id}_{CONNECTION_STATUS}"
+        # Dispatcher signals for WebSocket notifications, shared by all objects of the device.
+        self._signals = get_signals(self._unique_id)
+
     @staticmethod
     def get_device(hass: HomeAssistant, unique_id: str) -> dr.DeviceEntry:
         """Get the device."""
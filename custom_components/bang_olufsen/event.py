@@ -22,13 +22,10 @@ from homeassistant.helpers.entity_platform import (
 
 from . import HaloConfigEntry, MozartConfigEntry, set_platform_initialized
 from .const import (
-    BEO_REMOTE_CONTROL_KEYS,
     BEO_REMOTE_KEY_EVENTS,
-    BEO_REMOTE_KEYS,
-    BEO_REMOTE_SUBMENU_CONTROL,
-    BEO_REMOTE_SUBMENU_LIGHT,
+    BEO_REMOTE_KEY_PATHS,
+    BEO_REMOTE_KEY_TRANSLATION_KEYS,
     CONF_HALO,
-    CONNECTION_STATUS,
     DEVICE_BUTTON_EVENTS,
     DEVICE_BUTTONS,
     DOMAIN,
@@ -40,8 +37,8 @@ from .const import (
     WebsocketNotification,
 )
 from .entity import HaloEntity, MozartEntity
-from .halo import BaseUpdate, Notification, SystemEvent
-from .util import get_remotes, is_halo
+from .halo import BaseUpdate, Notification
+from .util import is_halo
 
 
 async def async_setup_entry(
@@ -94,8 +91,12 @@ class BangOlufsenEvent(EventEntity):
     _attr_entity_registry_enabled_default = False
 
     @callback
-    def _async_handle_event(self, event: str) -> None:
+    def async_handle_event(self, event: str) -> None:
         """Handle event."""
+        # Ignore unsupported event types, as _trigger_event raises for them
+        if event not in self.event_types:
+            return
+
         self._trigger_event(event)
         self.async_write_ha_state()
 
@@ -120,10 +121,8 @@ async def _get_mozart_entities(
     # Add physical "buttons"
     if config_entry.data[CONF_MODEL] in MODEL_SUPPORT_MAP[MODEL_SUPPORT_DEVICE_BUTTONS]:
         entities.extend(
-            [
-                BangOlufsenButtonEvent(config_entry, button_type)
-                for button_type in DEVICE_BUTTONS
-            ]
+            BangOlufsenButtonEvent(config_entry, button_type)
+            for button_type in DEVICE_BUTTONS
         )
 
     # Check if device supports proximity detection.
@@ -131,30 +130,17 @@ async def _get_mozart_entities(
         entities.append(BangOlufsenEventProximity(config_entry))
 
     # Check for connected Beoremote One
-    if remotes := await get_remotes(config_entry.runtime_data.client):
+    if remotes := config_entry.runtime_data.remotes:
         for remote in remotes:
-            # Add Light keys
-            entities.extend(
-                [
-                    BangOlufsenRemoteKeyEvent(
-                        config_entry,
-                        remote,
-                        f"{BEO_REMOTE_SUBMENU_LIGHT}/{key_type}",
-                    )
-                    for key_type in BEO_REMOTE_KEYS
-                ]
-            )
+            assert remote.serial_number
 
-            # Add Control keys
+            # Share the device info between all keys of the remote
+            device_info = DeviceInfo(identifiers={(DOMAIN, remote.serial_number)})
+
+            # Add Light and Control keys
             entities.extend(
-                [
-                    BangOlufsenRemoteKeyEvent(
-                        config_entry,
-                        remote,
-                        f"{BEO_REMOTE_SUBMENU_CONTROL}/{key_type}",
-                    )
-                    for key_type in (*BEO_REMOTE_KEYS, *BEO_REMOTE_CONTROL_KEYS)
-                ]
+                BangOlufsenRemoteKeyEvent(config_entry, remote, key_path, device_info)
+                for key_path in BEO_REMOTE_KEY_PATHS
             )
 
     return entities
@@ -182,17 +168,15 @@ class BangOlufsenButtonEvent(BangOlufsenMozartEvent):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{self._unique_id}_{WebsocketNotification.BUTTON}_{self._button_type}",
-                self._async_handle_event,
-            )
-        )
+
+        # Button events are delivered directly by the WebSocket listener
+        button_entities = self.entry.runtime_data.button_entities
+        button_entities[self._button_type] = self
+        self.async_on_remove(lambda: button_entities.pop(self._button_type, None))
 
 
 class BangOlufsenRemoteKeyEvent(BangOlufsenMozartEvent):
@@ -206,18 +190,15 @@ class BangOlufsenRemoteKeyEvent(BangOlufsenMozartEvent):
         config_entry: MozartConfigEntry,
         remote: PairedRemote,
         key_type: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize Beoremote One key."""
         super().__init__(config_entry)
 
-        assert remote.serial_number
-
         self._attr_unique_id = f"{remote.serial_number}_{key_type}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, remote.serial_number)}
-        )
+        self._attr_device_info = device_info
         # Make the native key name Home Assistant compatible
-        self._attr_translation_key = key_type.lower().replace("/", "_")
+        self._attr_translation_key = BEO_REMOTE_KEY_TRANSLATION_KEYS[key_type]
 
         self._key_type = key_type
 
@@ -226,17 +207,18 @@ class BangOlufsenRemoteKeyEvent(BangOlufsenMozartEvent):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{self._unique_id}_{WebsocketNotification.BEO_REMOTE_BUTTON}_{self._key_type}",
-                self._async_handle_event,
-            )
+
+        # Key events are delivered directly by the WebSocket listener.
+        # Multiple paired remotes share the same key types.
+        key_entities = self.entry.runtime_data.remote_key_entities.setdefault(
+            self._key_type, []
         )
+        key_entities.append(self)
+        self.async_on_remove(lambda: key_entities.remove(self))
 
 
 class BangOlufsenEventProximity(BangOlufsenMozartEvent):
@@ -257,15 +239,15 @@ class BangOlufsenEventProximity(BangOlufsenMozartEvent):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.PROXIMITY}",
-                self._async_handle_event,
+                self._signals[WebsocketNotification.PROXIMITY],
+                self.async_handle_event,
             )
         )
 
@@ -307,24 +289,18 @@ class BangOlufsenEventHaloSystem(BangOlufsenHaloEvent):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.HALO_SYSTEM}",
-                self._update_system,
+                self._signals[WebsocketNotification.HALO_SYSTEM],
+                self.async_handle_event,
             )
         )
 
-    @callback
-    def _update_system(self, event: SystemEvent) -> None:
-        """Handle system event."""
-        self._trigger_event(event.state)
-        self.async_write_ha_state()
-
     # Setup custom actions
     def async_halo_configuration(self) -> ServiceResponse:
         """Get raw configuration for the Halo."""
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import timedelta
-import json
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from aiohttp import ClientConnectorError
 from mozart_api import __version__ as MOZART_API_VERSION
@@ -67,6 +67,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
 )
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceEntry, DeviceInfo
 from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
@@ -77,12 +78,12 @@ from homeassistant.helpers.entity_platform import (
     async_get_current_platform,
 )
 from homeassistant.util.dt import utcnow
-from homeassistant.util.json import JsonObjectType
+from homeassistant.util.json import JsonObjectType, json_loads
 
 from . import MANUFACTURER, MozartConfigEntry, set_platform_initialized
 from .const import (
     ACCEPTED_COMMANDS,
-    ACCEPTED_COMMANDS_LISTS,
+    ACCEPTED_COMMANDS_TYPES,
     BANG_OLUFSEN_REPEAT_FROM_HA,
     BANG_OLUFSEN_REPEAT_TO_HA,
     BANG_OLUFSEN_STATES,
@@ -93,16 +94,21 @@ from .const import (
     BEOLINK_RELATIVE_VOLUME,
     BEOLINK_VOLUME,
     CONF_BEOLINK_JID,
-    CONNECTION_STATUS,
+    DEFAULT_SOURCE_IDS,
     DOMAIN,
-    FALLBACK_SOURCES,
+    NO_PROGRESS_SOURCE_IDS,
     VALID_MEDIA_TYPES,
+    VALID_MEDIA_TYPES_ORDERED,
     BangOlufsenMediaType,
     BangOlufsenSource,
     WebsocketNotification,
+    get_fallback_sources,
 )
 from .entity import MozartEntity
-from .util import get_serial_number_from_jid
+from .util import (
+    CoalescedRequests,
+    get_serial_number_from_jid,
+)
 
 PARALLEL_UPDATES = 0
 
@@ -131,6 +137,19 @@ BANG_OLUFSEN_FEATURES = (
     | MediaPlayerEntityFeature.VOLUME_SET
 )
 
+# Beolink JID validator shared by the Beolink services
+_JID_SCHEMA = vol.Match(r"(^\d{4})[.](\d{7})[.](\d{8})(@products\.bang-olufsen\.com)$")
+
+# Play queue providers for the Deezer and Tidal media types
+_PLAY_QUEUE_PROVIDERS: dict[str, PlayQueueItemType] = {
+    media_type: PlayQueueItemType(value=media_type)
+    for media_type in (BangOlufsenMediaType.DEEZER, BangOlufsenMediaType.TIDAL)
+}
+
+# Maximum number of concurrent Beolink expand / unexpand requests to the device.
+# Each expand request also polls the Beolink listeners until the peer has joined.
+_BEOLINK_CONCURRENT_REQUESTS = 2
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -149,14 +168,10 @@ async def async_setup_entry(
     # Register services.
     platform = async_get_current_platform()
 
-    jid_regex = vol.Match(
-        r"(^\d{4})[.](\d{7})[.](\d{8})(@products\.bang-olufsen\.com)$"
-    )
-
     platform.async_register_entity_service(
         name="beolink_join",
         schema={
-            vol.Optional("beolink_jid"): jid_regex,
+            vol.Optional("beolink_jid"): _JID_SCHEMA,
             vol.Optional("source_id"): vol.In(BEOLINK_JOIN_SOURCES),
         },
         func="async_beolink_join",
@@ -173,7 +188,7 @@ async def async_setup_entry(
                 "Define either specific Beolink JIDs or all discovered",
             ): vol.All(
                 cv.ensure_list,
-                [jid_regex],
+                [_JID_SCHEMA],
             ),
         },
         func="async_beolink_expand",
@@ -185,7 +200,7 @@ async def async_setup_entry(
         schema={
             vol.Required("beolink_jids"): vol.All(
                 cv.ensure_list,
-                [jid_regex],
+                [_JID_SCHEMA],
             ),
         },
         func="async_beolink_unexpand",
@@ -262,6 +277,8 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
             state=SoftwareUpdateState(seconds_remaining=0, value="idle"),
         )
         self._sources: dict[str, str] = {}
+        # Source friendly names to source ID's for source selection
+        self._source_ids: dict[str, str] = {}
         self._state: str = MediaPlayerState.IDLE
         self._video_sources: dict[str, str] = {}
         self._sound_modes: dict[str, int] = {}
@@ -275,50 +292,100 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
 
         self._favourite_attribute: dict[str, dict[str, Any]] = {}
 
+        # Limit concurrent Beolink expand / unexpand requests
+        self._beolink_semaphore = asyncio.Semaphore(_BEOLINK_CONCURRENT_REQUESTS)
+
+        # Pending coalesced state write
+        self._state_write_handle: asyncio.Handle | None = None
+
     async def async_added_to_hass(self) -> None:
         """Turn on the dispatchers."""
         await super().async_added_to_hass()
 
+        self._entity_registry = er.async_get(self.hass)
+
+        # Bursts of Beolink and metadata notifications are common when a Beolink session changes.
+        # Limit the resulting Beolink API requests.
+        self._beolink_debouncer = Debouncer(
+            self.hass,
+            _LOGGER,
+            cooldown=1.0,
+            immediate=True,
+            function=self._async_update_beolink,
+        )
+        self.async_on_remove(self._beolink_debouncer.async_shutdown)
+        self.async_on_remove(self._cancel_state_write)
+
+        # Seek requests, sending only the latest position while a request is in flight
+        self._seek_requests = CoalescedRequests(
+            lambda position_ms: self._client.seek_to_position(position_ms=position_ms),
+            lambda coro: self.entry.async_create_background_task(
+                self.hass, coro, f"{DOMAIN}-{self._unique_id}-seek_requests"
+            ),
+        )
+        self.async_on_remove(self._seek_requests.async_cancel)
+
+        # Volume requests, sending only the latest volume while a request is in flight
+        self._volume_requests = CoalescedRequests(
+            lambda volume_level: self._client.set_current_volume_level(
+                volume_level=VolumeLevel(level=volume_level)
+            ),
+            lambda coro: self.entry.async_create_background_task(
+                self.hass, coro, f"{DOMAIN}-{self._unique_id}-volume_requests"
+            ),
+        )
+        self.async_on_remove(self._volume_requests.async_cancel)
+
         await self._initialize()
 
-        signal_handler_map: dict[str, dict[str, Callable]] = {
-            self._beolink_jid: {
-                BEOLINK_LEADER_COMMAND: self.async_beolink_leader_command,
-                BEOLINK_LISTENER_COMMAND: self.async_beolink_listener_command,
-                BEOLINK_RELATIVE_VOLUME: self.async_beolink_set_relative_volume,
-                BEOLINK_VOLUME: self.async_beolink_set_volume,
-            },
-            self._unique_id: {
-                CONNECTION_STATUS: self._async_update_connection_state,
-                WebsocketNotification.ACTIVE_LISTENING_MODE: self._async_update_sound_modes,
-                WebsocketNotification.BEOLINK: self._async_update_beolink,
-                WebsocketNotification.CONFIGURATION: self._async_update_name_and_beolink,
-                WebsocketNotification.PLAYBACK_ERROR: self._async_update_playback_error,
-                WebsocketNotification.PLAYBACK_METADATA: self._async_update_playback_metadata_and_beolink,
-                WebsocketNotification.PLAYBACK_PROGRESS: self._async_update_playback_progress,
-                WebsocketNotification.PLAYBACK_SOURCE: self._async_update_sources,
-                WebsocketNotification.PLAYBACK_STATE: self._async_update_playback_state,
-                WebsocketNotification.REMOTE_MENU_CHANGED: self._async_update_sources,
-                WebsocketNotification.SOURCE_CHANGE: self._async_update_source_change,
-                WebsocketNotification.VOLUME: self._async_update_volume,
-            },
+        notification_handler_map: dict[WebsocketNotification, Callable] = {
+            WebsocketNotification.ACTIVE_LISTENING_MODE: self._async_update_sound_modes,
+            WebsocketNotification.BEOLINK: self._beolink_debouncer.async_call,
+            WebsocketNotification.CONFIGURATION: self._async_update_name_and_beolink,
+            WebsocketNotification.PLAYBACK_ERROR: self._async_update_playback_error,
+            WebsocketNotification.PLAYBACK_METADATA: self._async_update_playback_metadata_and_beolink,
+            WebsocketNotification.PLAYBACK_PROGRESS: self._async_update_playback_progress,
+            WebsocketNotification.PLAYBACK_SOURCE: self._async_update_sources,
+            WebsocketNotification.PLAYBACK_STATE: self._async_update_playback_state,
+            WebsocketNotification.REMOTE_MENU_CHANGED: self._async_update_sources,
+            WebsocketNotification.SOURCE_CHANGE: self._async_update_source_change,
+            WebsocketNotification.VOLUME: self._async_update_volume,
         }
 
-        for signal_prefix, signal_handlers in signal_handler_map.items():
-            for signal, signal_handler in signal_handlers.items():
-                self.async_on_remove(
-                    async_dispatcher_connect(
-                        self.hass,
-                        f"{signal_prefix}_{signal}",
-                        signal_handler,
-                    )
-                )
+        signal_handler_map: dict[str, Callable] = {
+            f"{self._beolink_jid}_{BEOLINK_LEADER_COMMAND}": self.async_beolink_leader_command,
+            f"{self._beolink_jid}_{BEOLINK_LISTENER_COMMAND}": self.async_beolink_listener_command,
+            f"{self._beolink_jid}_{BEOLINK_RELATIVE_VOLUME}": self.async_beolink_set_relative_volume,
+            f"{self._beolink_jid}_{BEOLINK_VOLUME}": self.async_beolink_set_volume,
+            self._connection_signal: self._async_update_connection_state,
+        }
+        # Use the prebuilt WebSocket notification signals
+        signal_handler_map.update(
+            (self._signals[notification], handler)
+            for notification, handler in notification_handler_map.items()
+        )
+
+        for signal, signal_handler in signal_handler_map.items():
+            self.async_on_remove(
+                async_dispatcher_connect(self.hass, signal, signal_handler)
+            )
 
     async def _initialize(self) -> None:
         """Initialize connection dependent variables."""
 
-        # Get software version.
-        self._software_status = await self._client.get_softwareupdate_status()
+        # Get software version and overall device state once.
+        # The device state is handled by WebSocket events the rest of the time.
+        # The task group cancels the remaining request if one of them fails
+        async with asyncio.TaskGroup() as task_group:
+            software_status_task = task_group.create_task(
+                self._client.get_softwareupdate_status()
+            )
+            product_state_task = task_group.create_task(
+                self._client.get_product_state()
+            )
+
+        self._software_status = software_status_task.result()
+        product_state = product_state_task.result()
 
         _LOGGER.debug(
             "Connected to: %s %s running SW %s",
@@ -327,9 +394,6 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
             self._software_status.software_version,
         )
 
-        # Get overall device state once. This is handled by WebSocket events the rest of the time.
-        product_state = await self._client.get_product_state()
-
         # Get volume information.
         if product_state.volume:
             self._volume = product_state.volume
@@ -355,23 +419,24 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         # Get the highest resolution available of the given images.
         self._media_image = get_highest_resolution_artwork(self._playback_metadata)
 
+        # Update sources, sound modes, beolink attributes and device name concurrently.
         # If the device has been updated with new sources, then the API will fail here.
-        await self._async_update_sources()
-
-        await self._async_update_sound_modes()
-
-        # Update beolink attributes and device name.
-        await self._async_update_name_and_beolink()
+        async with asyncio.TaskGroup() as task_group:
+            task_group.create_task(self._async_update_sources())
+            task_group.create_task(self._async_update_sound_modes())
+            task_group.create_task(self._async_update_name_and_beolink())
 
     async def async_update(self) -> None:
         """Update queue settings."""
         # The WebSocket event listener is the main handler for connection state.
         # The polling updates do therefore not set the device as available or unavailable
         with contextlib.suppress(ApiException, ClientConnectorError, TimeoutError):
-            favourites = await self._client.get_presets(_request_timeout=5)
+            favourites, queue_settings = await asyncio.gather(
+                self._client.get_presets(_request_timeout=5),
+                self._client.get_settings_queue(_request_timeout=5),
+            )
             await self._generate_favourite_attributes(favourites)
 
-            queue_settings = await self._client.get_settings_queue(_request_timeout=5)
             if queue_settings.repeat is not None:
                 self._attr_repeat = BANG_OLUFSEN_REPEAT_TO_HA[queue_settings.repeat]
 
@@ -393,11 +458,12 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
                 if source.id and source.name
             }
 
-        self._favourite_attribute = {"favourites": {}}
+        favourites_attribute: dict[str, Any] = {}
 
         # Handle each favourite
         for favourite_id, favourite in favourites.items():
-            favourite_attribute = {"title": favourite.title}
+            source_name: str | None = None
+            content_id: str | None = None
 
             # Handle each action
             for action in cast(list[Action], favourite.action_list):
@@ -412,36 +478,47 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
 
                 # Add friendly name if it has been defined
                 if source:
-                    favourite_attribute["source"] = self._unsorted_sources[source]
+                    source_name = self._unsorted_sources[source]
 
                 # Add content id if available
-                content_id = ""
+                action_content_id = ""
                 if action.content_id:
                     # Determine if a netradio id should be split
                     if "netRadio" in action.content_id:
-                        content_id = action.content_id.split("netRadio://")[1]
+                        action_content_id = action.content_id.split("netRadio://")[1]
                 elif action.queue_item:
                     # Determine if a netradio id should be split
                     if "tidal" in action.queue_item.uri:
-                        content_id = action.queue_item.uri.split("tidal://")[1]
+                        action_content_id = action.queue_item.uri.split("tidal://")[1]
                     else:
-                        content_id = action.queue_item.uri
+                        action_content_id = action.queue_item.uri
                 elif action.deezer_user_id:
-                    content_id = action.deezer_user_id
+                    action_content_id = action.deezer_user_id
 
                 # Add content id if it has been defined
-                if content_id:
-                    favourite_attribute["content_id"] = content_id
+                if action_content_id:
+                    content_id = action_content_id
 
             # Check content for source if it hasn't been defined in actionlist
-            if "source" not in favourite_attribute:
-                if favourite.content and favourite.content.source.value:
-                    favourite_attribute["source"] = self._unsorted_sources[
-                        favourite.content.source.value
-                    ]
+            if (
+                source_name is None
+                and favourite.content
+                and favourite.content.source.value
+            ):
+                source_name = self._unsorted_sources[favourite.content.source.value]
+
+            # Build the favourite attribute once all actions have been handled
+            favourite_attribute: dict[str, Any] = {"title": favourite.title}
+            if source_name is not None:
+                favourite_attribute["source"] = source_name
+            if content_id is not None:
+                favourite_attribute["content_id"] = content_id
 
             # Add current favourite to attribute
-            self._favourite_attribute["favourites"][favourite_id] = favourite_attribute
+            favourites_attribute[favourite_id] = favourite_attribute
+
+        self._favourite_attribute = {"favourites": favourites_attribute}
+        self._update_extra_state_attributes()
 
     async def _async_update_sources(self, _: Source | None = None) -> None:
         """Get sources for the specific product."""
@@ -464,7 +541,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
                 MOZART_API_VERSION,
                 sw_version,
             )
-            sources = FALLBACK_SOURCES
+            sources = get_fallback_sources()
 
         # Save all of the relevant enabled sources, both the ID and the friendly name for displaying in a dict.
         self._audio_sources = {
@@ -509,9 +586,14 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         # Combine the source dicts
         self._sources = self._audio_sources | self._video_sources
 
+        # Audio sources take precedence if an audio and a video source share a name
+        self._source_ids = {
+            name: source_id for source_id, name in reversed(self._sources.items())
+        }
+
         self._attr_source_list = list(self._sources.values())
 
-        self.async_write_ha_state()
+        self._schedule_state_write()
 
     async def _async_update_playback_metadata_and_beolink(
         self, data: PlaybackContentMetadata
@@ -519,9 +601,13 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         """Update _playback_metadata and related."""
         self._playback_metadata = data
 
-        # Update current artwork and remote_leader.
+        # Update current artwork.
         self._media_image = get_highest_resolution_artwork(self._playback_metadata)
-        await self._async_update_beolink()
+
+        self._schedule_state_write()
+
+        # Update remote_leader.
+        await self._beolink_debouncer.async_call()
 
     @callback
     def _async_update_playback_error(self, data: PlaybackError) -> None:
@@ -531,31 +617,35 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
     @callback
     def _async_update_playback_progress(self, data: PlaybackProgress) -> None:
         """Update _playback_progress and last update."""
+        # Skip repeated identical progress notifications
+        if data == self._playback_progress:
+            return
+
         self._playback_progress = data
         self._attr_media_position_updated_at = utcnow()
 
-        self.async_write_ha_state()
+        self._schedule_state_write()
 
     @callback
     def _async_update_playback_state(self, data: RenderingState) -> None:
         """Update _playback_state and related."""
+        if data == self._playback_state:
+            return
+
         self._playback_state = data
 
         # Update entity state based on the playback state.
         if self._playback_state.value:
             self._state = self._playback_state.value
 
-            self.async_write_ha_state()
+            self._schedule_state_write()
 
     async def _async_update_source_change(self, data: Source) -> None:
         """Update _source_change and related."""
         self._source_change = data
 
         # Check if source is line-in or optical and progress should be updated
-        if self._source_change.id in (
-            BangOlufsenSource.LINE_IN.id,
-            BangOlufsenSource.SPDIF.id,
-        ):
+        if self._source_change.id in NO_PROGRESS_SOURCE_IDS:
             self._playback_progress = PlaybackProgress(progress=0)
 
         # Try to ensure that a source is active (not unknown).
@@ -566,10 +656,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
 
             # Get USB or Line-in, depending on which one of them is enabled
             for source in cast(list[Source], sources.items):
-                if source.is_enabled and source.id in (
-                    BangOlufsenSource.LINE_IN.id,
-                    BangOlufsenSource.USB_IN.id,
-                ):
+                if source.is_enabled and source.id in DEFAULT_SOURCE_IDS:
                     default_source = source.id
                     break
 
@@ -582,14 +669,17 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
                 f". Defaulting to {default_source}" if default_source else "",
             )
 
-        self.async_write_ha_state()
+        self._schedule_state_write()
 
     @callback
     def _async_update_volume(self, data: VolumeState) -> None:
         """Update _volume."""
+        if data == self._volume:
+            return
+
         self._volume = data
 
-        self.async_write_ha_state()
+        self._schedule_state_write()
 
     async def _async_update_name_and_beolink(self) -> None:
         """Update the device friendly name."""
@@ -607,6 +697,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
     async def _async_update_beolink(self) -> None:
         """Update the current Beolink leader, listeners, peers and self."""
 
+        previous_beolink_attributes = self._beolink_attributes
         self._beolink_attributes = {}
 
         assert self.device_entry
@@ -620,11 +711,9 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         peers = await self._client.get_beolink_peers()
 
         if len(peers) > 0:
-            self._beolink_attributes["beolink"]["peers"] = {}
-            for peer in peers:
-                self._beolink_attributes["beolink"]["peers"][peer.friendly_name] = (
-                    peer.jid
-                )
+            self._beolink_attributes["beolink"]["peers"] = {
+                peer.friendly_name: peer.jid for peer in peers
+            }
 
         # Add Beolink listeners / leader
         self._remote_leader = self._playback_metadata.remote_leader
@@ -674,39 +763,70 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
                     ]
                 )
                 # Update Beolink attributes
+                # Get the friendly names for the listeners from the peers
+                peer_names = {peer.jid: peer.friendly_name for peer in peers}
                 for beolink_listener in self._beolink_listeners:
-                    for peer in peers:
-                        if peer.jid == beolink_listener.jid:
-                            # Get the friendly names for the listeners from the peers
-                            beolink_listeners_attribute[peer.friendly_name] = (
-                                beolink_listener.jid
-                            )
-                            break
+                    if (peer_name := peer_names.get(beolink_listener.jid)) is not None:
+                        beolink_listeners_attribute[peer_name] = beolink_listener.jid
                 self._beolink_attributes["beolink"]["listeners"] = (
                     beolink_listeners_attribute
                 )
 
+        # Remove duplicate members while keeping the leader first
+        group_members = list(dict.fromkeys(group_members))
+
+        # Skip the state write if the Beolink session is unchanged
+        if (
+            group_members == self._attr_group_members
+            and self._beolink_attributes == previous_beolink_attributes
+        ):
+            return
+
         self._attr_group_members = group_members
+        self._update_extra_state_attributes()
+
+        self._schedule_state_write()
+
+    @callback
+    def _update_extra_state_attributes(self) -> None:
+        """Merge the Beolink and favourite attributes into the extra state attributes."""
+        self._attr_extra_state_attributes = (
+            self._beolink_attributes | self._favourite_attribute
+        )
 
+    @callback
+    def _schedule_state_write(self) -> None:
+        """Schedule a single state write for all updates handled in the current event loop iteration."""
+        if self._state_write_handle is None:
+            self._state_write_handle = self.hass.loop.call_soon(self._flush_state_write)
+
+    @callback
+    def _flush_state_write(self) -> None:
+        """Write the coalesced state."""
+        self._state_write_handle = None
         self.async_write_ha_state()
 
+    @callback
+    def _cancel_state_write(self) -> None:
+        """Cancel a pending state write."""
+        if self._state_write_handle is not None:
+            self._state_write_handle.cancel()
+            self._state_write_handle = None
+
     def _get_entity_id_from_jid(self, jid: str) -> str | None:
         """Get entity_id from Beolink JID (if available)."""
 
         unique_id = get_serial_number_from_jid(jid)
 
-        entity_registry = er.async_get(self.hass)
-        return entity_registry.async_get_entity_id(
+        return self._entity_registry.async_get_entity_id(
             Platform.MEDIA_PLAYER, DOMAIN, unique_id
         )
 
     def _get_beolink_jid(self, entity_id: str) -> str:
         """Get beolink JID from entity_id."""
 
-        entity_registry = er.async_get(self.hass)
-
         # Check for valid bang_olufsen media_player entity
-        entity_entry = entity_registry.async_get(entity_id)
+        entity_entry = self._entity_registry.async_get(entity_id)
 
         if (
             entity_entry is None
@@ -733,10 +853,13 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         self, active_sound_mode: ListeningModeProps | ListeningModeRef | None = None
     ) -> None:
         """Update the available sound modes."""
-        sound_modes = await self._client.get_listening_mode_set()
-
         if active_sound_mode is None:
-            active_sound_mode = await self._client.get_active_listening_mode()
+            sound_modes, active_sound_mode = await asyncio.gather(
+                self._client.get_listening_mode_set(),
+                self._client.get_active_listening_mode(),
+            )
+        else:
+            sound_modes = await self._client.get_listening_mode_set()
 
         # Add the key to make the labels unique (As labels are not required to be unique on B&O devices)
         for sound_mode in sound_modes:
@@ -750,7 +873,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         # Set available options
         self._attr_sound_mode_list = list(self._sound_modes)
 
-        self.async_write_ha_state()
+        self._schedule_state_write()
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
@@ -766,7 +889,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
     @property
     def state(self) -> MediaPlayerState:
         """Return the current state of the media player."""
-        return BANG_OLUFSEN_STATES[self._state]
+        return BANG_OLUFSEN_STATES.get(self._state, MediaPlayerState.IDLE)
 
     @property
     def volume_level(self) -> float | None:
@@ -840,21 +963,6 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         """Return the current audio source."""
         return self._source_change.name
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
-        """Return information that is not returned anywhere else."""
-        attributes: dict[str, Any] = {}
-
-        # Add Beolink attributes
-        if self._beolink_attributes:
-            attributes.update(self._beolink_attributes)
-
-        # Add favourite attributes
-        if self._favourite_attribute:
-            attributes.update(self._favourite_attribute)
-
-        return attributes
-
     async def async_turn_off(self) -> None:
         """Set the device to "networkStandby"."""
         await self._client.post_standby()
@@ -877,9 +985,8 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
             )
             new_volume = self._volume.maximum.level
 
-        await self._client.set_current_volume_level(
-            volume_level=VolumeLevel(level=new_volume)
-        )
+        # Only send the latest volume when the volume is changed rapidly, e.g. when holding volume up
+        await self._volume_requests.async_send(new_volume)
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute or unmute media player."""
@@ -910,7 +1017,8 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
 
     async def async_media_seek(self, position: float) -> None:
         """Seek to position in ms."""
-        await self._client.seek_to_position(position_ms=int(position * 1000))
+        # Only send the latest position when seeking rapidly, e.g. when dragging the seek bar
+        await self._seek_requests.async_send(int(position * 1000))
         # Try to prevent the playback progress from bouncing in the UI.
         self._attr_media_position_updated_at = utcnow()
         self._playback_progress = PlaybackProgress(progress=int(position))
@@ -941,7 +1049,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
 
     async def async_select_source(self, source: str) -> None:
         """Select an input source."""
-        if source not in self._sources.values():
+        if (key := self._source_ids.get(source)) is None:
             raise ServiceValidationError(
                 translation_domain=DOMAIN,
                 translation_key="invalid_source",
@@ -951,10 +1059,8 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
                 },
             )
 
-        key = [x for x in self._sources if self._sources[x] == source][0]
-
         # Check for source type
-        if source in self._audio_sources.values():
+        if key in self._audio_sources:
             # Audio
             await self._client.set_active_source(source_id=key)
         else:
@@ -994,7 +1100,7 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
                 translation_key="invalid_media_type",
                 translation_placeholders={
                     "invalid_media_type": media_type,
-                    "valid_media_types": ",".join(VALID_MEDIA_TYPES),
+                    "valid_media_types": ",".join(VALID_MEDIA_TYPES_ORDERED),
                 },
             )
 
@@ -1045,82 +1151,96 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
                 overlay_play_request.uri = Uri(location=media_id)
 
             await self._client.post_overlay_play(overlay_play_request)
+            return
 
-        elif media_type in (MediaType.URL, MediaType.MUSIC):
-            await self._client.post_uri_source(uri=Uri(location=media_id))
+        match media_type:
+            case MediaType.URL | MediaType.MUSIC:
+                await self._client.post_uri_source(uri=Uri(location=media_id))
 
-        # The "provider" media_type may not be suitable for overlay all the time.
-        # Use it for now.
-        elif media_type == BangOlufsenMediaType.TTS:
-            await self._client.post_overlay_play(
-                overlay_play_request=OverlayPlayRequest(
-                    uri=Uri(location=media_id),
+            # The "provider" media_type may not be suitable for overlay all the time.
+            # Use it for now.
+            case BangOlufsenMediaType.TTS:
+                await self._client.post_overlay_play(
+                    overlay_play_request=OverlayPlayRequest(
+                        uri=Uri(location=media_id),
+                    )
                 )
-            )
 
-        elif media_type == BangOlufsenMediaType.RADIO:
-            await self._client.run_provided_scene(
-                scene_properties=SceneProperties(
-                    action_list=[
-                        Action(
-                            type="radio",
-                            radio_station_id=media_id,
-                        )
-                    ]
+            case BangOlufsenMediaType.RADIO:
+                await self._client.run_provided_scene(
+                    scene_properties=SceneProperties(
+                        action_list=[
+                            Action(
+                                type="radio",
+                                radio_station_id=media_id,
+                            )
+                        ]
+                    )
                 )
-            )
 
-        elif media_type == BangOlufsenMediaType.FAVOURITE:
-            await self._client.activate_preset(id=int(media_id))
+            case BangOlufsenMediaType.FAVOURITE:
+                await self._client.activate_preset(id=int(media_id))
 
-        elif media_type in (BangOlufsenMediaType.DEEZER, BangOlufsenMediaType.TIDAL):
-            try:
-                # Play Deezer flow.
-                if media_id == "flow" and media_type == BangOlufsenMediaType.DEEZER:
-                    deezer_id = None
+            case BangOlufsenMediaType.DEEZER | BangOlufsenMediaType.TIDAL:
+                await self._async_play_deezer_tidal(media_type, media_id, **kwargs)
 
-                    if "id" in kwargs[ATTR_MEDIA_EXTRA]:
-                        deezer_id = kwargs[ATTR_MEDIA_EXTRA]["id"]
+    async def _async_play_deezer_tidal(
+        self, media_type: str, media_id: str, **kwargs: Any
+    ) -> None:
+        """Play Deezer flow or a Deezer / Tidal playlist, album or track."""
+        try:
+            # Play Deezer flow.
+            if media_id == "flow" and media_type == BangOlufsenMediaType.DEEZER:
+                deezer_id = None
 
-                    await self._client.start_deezer_flow(
-                        user_flow=UserFlow(user_id=deezer_id)
-                    )
+                if "id" in kwargs[ATTR_MEDIA_EXTRA]:
+                    deezer_id = kwargs[ATTR_MEDIA_EXTRA]["id"]
 
-                # Play a playlist or album.
-                elif any(match in media_id for match in ("playlist", "album")):
-                    start_from = 0
-                    if "start_from" in kwargs[ATTR_MEDIA_EXTRA]:
-                        start_from = kwargs[ATTR_MEDIA_EXTRA]["start_from"]
-
-                    await self._client.add_to_queue(
-                        play_queue_item=PlayQueueItem(
-                            provider=PlayQueueItemType(value=media_type),
-                            start_now_from_position=start_from,
-                            type="playlist",
-                            uri=media_id,
-                        )
+                await self._client.start_deezer_flow(
+                    user_flow=UserFlow(user_id=deezer_id)
+                )
+
+            # Play a playlist or album.
+            elif "playlist" in media_id or "album" in media_id:
+                start_from = 0
+                if "start_from" in kwargs[ATTR_MEDIA_EXTRA]:
+                    start_from = kwargs[ATTR_MEDIA_EXTRA]["start_from"]
+
+                await self._client.add_to_queue(
+                    play_queue_item=PlayQueueItem(
+                        provider=_PLAY_QUEUE_PROVIDERS[media_type],
+                        start_now_from_position=start_from,
+                        type="playlist",
+                        uri=media_id,
                     )
+                )
 
-                # Play a track.
-                else:
-                    await self._client.add_to_queue(
-                        play_queue_item=PlayQueueItem(
-                            provider=PlayQueueItemType(value=media_type),
-                            start_now_from_position=0,
-                            type="track",
-                            uri=media_id,
-                        )
+            # Play a track.
+            else:
+                await self._client.add_to_queue(
+                    play_queue_item=PlayQueueItem(
+                        provider=_PLAY_QUEUE_PROVIDERS[media_type],
+                        start_now_from_position=0,
+                        type="track",
+                        uri=media_id,
                     )
+                )
 
-            except ApiException as error:
-                raise HomeAssistantError(
-                    translation_domain=DOMAIN,
-                    translation_key="play_media_error",
-                    translation_placeholders={
-                        "media_type": media_type,
-                        "error_message": json.loads(error.body)["message"],
-                    },
-                ) from error
+        except ApiException as error:
+            # Fall back to the raw body or reason if the body is not the expected JSON
+            try:
+                error_message = str(json_loads(error.body)["message"])
+            except (ValueError, TypeError, KeyError):
+                error_message = str(error.body or error.reason)
+
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="play_media_error",
+                translation_placeholders={
+                    "media_type": media_type,
+                    "error_message": error_message,
+                },
+            ) from error
 
     async def async_browse_media(
         self,
@@ -1211,21 +1331,19 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         # Expand to all discovered devices
         if all_discovered:
             peers = await self._client.get_beolink_peers()
+            beolink_jids = [peer.jid for peer in peers]
+
+        # Try to expand to all defined devices, a few at a time
+        if beolink_jids:
+            responses = await asyncio.gather(
+                *(
+                    self._async_beolink_expand_jid(beolink_jid)
+                    for beolink_jid in beolink_jids
+                )
+            )
 
-            for peer in peers:
-                response = await self._client.async_post_beolink_expand(peer.jid)
-
-                # Add result
-                result[peer.jid] = {
-                    "result": response if response is True else type(response).__name__
-                }
-
-        # Try to expand to all defined devices
-        elif beolink_jids:
-            for beolink_jid in beolink_jids:
-                response = await self._client.async_post_beolink_expand(beolink_jid)
-
-                # Add result
+            # Add results
+            for beolink_jid, response in zip(beolink_jids, responses, strict=True):
                 result[beolink_jid] = {
                     "result": response if response is True else type(response).__name__
                 }
@@ -1234,8 +1352,24 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
 
     async def async_beolink_unexpand(self, beolink_jids: list[str]) -> None:
         """Unexpand a Beolink multi-room experience with a device or devices."""
-        # Unexpand all defined devices
-        for beolink_jid in beolink_jids:
+        # Unexpand all defined devices, a few at a time
+        await asyncio.gather(
+            *(
+                self._async_beolink_unexpand_jid(beolink_jid)
+                for beolink_jid in beolink_jids
+            )
+        )
+
+    async def _async_beolink_expand_jid(
+        self, beolink_jid: str
+    ) -> Literal[True] | Exception:
+        """Expand to a device, limited by the Beolink request semaphore."""
+        async with self._beolink_semaphore:
+            return await self._client.async_post_beolink_expand(beolink_jid)
+
+    async def _async_beolink_unexpand_jid(self, beolink_jid: str) -> None:
+        """Unexpand a device, limited by the Beolink request semaphore."""
+        async with self._beolink_semaphore:
             await self._client.post_beolink_unexpand(jid=beolink_jid)
 
     async def async_beolink_leave(self) -> None:
@@ -1250,73 +1384,71 @@ class BangOlufsenMediaPlayer(MediaPlayerEntity, MozartEntity):
         self, command: str, parameter: str | None = None
     ) -> None:
         """Receive a command from the Beolink leader."""
-        for command_list in ACCEPTED_COMMANDS_LISTS:
-            if command in command_list:
-                # Get the parameter type.
-                parameter_type: type[float | bool | str] | None = command_list[-1]
+        if command not in ACCEPTED_COMMANDS_TYPES:
+            return
 
-                # Run the command.
-                if parameter is not None:
-                    await getattr(self, f"async_{command}")(parameter_type(parameter))  # type: ignore[misc]
+        # Get the parameter type.
+        parameter_type = ACCEPTED_COMMANDS_TYPES[command]
 
-                elif parameter_type is None:
-                    await getattr(self, f"async_{command}")()
+        # Run the command.
+        if parameter is not None:
+            await getattr(self, f"async_{command}")(parameter_type(parameter))  # type: ignore[misc]
 
-                return
+        elif parameter_type is None:
+            await getattr(self, f"async_{command}")()
 
     async def async_beolink_leader_command(
         self, command: str, parameter: float | bool | str | None = None
     ) -> None:
         """Send a command to the Beolink leader."""
-        for command_list in ACCEPTED_COMMANDS_LISTS:
-            if command in command_list:
-                # Get the parameter type.
-                parameter_type: type[float | bool | str] | None = command_list[-1]
-
-                # Check for valid parameter type.
-                if parameter_type is not None:
-                    try:
-                        # Test the cast before assigning
-                        parameter = parameter_type(parameter)  # type: ignore[arg-type]
-                    except (ValueError, TypeError, Exception) as error:
-                        raise HomeAssistantError(
-                            translation_domain=DOMAIN,
-                            translation_key="invalid_beolink_parameter",
-                            translation_placeholders={
-                                "parameter": str(parameter),
-                                "parameter_type": parameter_type.__name__,
-                                "command": command,
-                            },
-                        ) from error
-
-                elif parameter_type is None and parameter is not None:
-                    raise HomeAssistantError(
-                        translation_domain=DOMAIN,
-                        translation_key="invalid_beolink_parameter",
-                        translation_placeholders={
-                            "parameter": parameter,  # type: ignore[dict-item]
-                            "parameter_type": str(parameter_type),
-                            "command": command,
-                        },
-                    )
+        if command not in ACCEPTED_COMMANDS_TYPES:
+            return
 
-                # Forward the command to the leader if a listener.
-                if self._remote_leader is not None:
-                    async_dispatcher_send(
-                        self.hass,
-                        f"{self._remote_leader.jid}_{BEOLINK_LEADER_COMMAND}",
-                        command,
-                        parameter,
-                    )
+        # Get the parameter type.
+        parameter_type = ACCEPTED_COMMANDS_TYPES[command]
 
-                # Run the command if leader.
-                elif parameter is not None:
-                    await getattr(self, f"async_{command}")(parameter_type(parameter))  # type: ignore[misc]
+        # Check for valid parameter type.
+        if parameter_type is not None:
+            try:
+                # Test the cast before assigning
+                parameter = parameter_type(parameter)  # type: ignore[arg-type]
+            except (ValueError, TypeError, Exception) as error:
+                raise HomeAssistantError(
+                    translation_domain=DOMAIN,
+                    translation_key="invalid_beolink_parameter",
+                    translation_placeholders={
+                        "parameter": str(parameter),
+                        "parameter_type": parameter_type.__name__,
+                        "command": command,
+                    },
+                ) from error
+
+        elif parameter_type is None and parameter is not None:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="invalid_beolink_parameter",
+                translation_placeholders={
+                    "parameter": parameter,  # type: ignore[dict-item]
+                    "parameter_type": str(parameter_type),
+                    "command": command,
+                },
+            )
+
+        # Forward the command to the leader if a listener.
+        if self._remote_leader is not None:
+            async_dispatcher_send(
+                self.hass,
+                f"{self._remote_leader.jid}_{BEOLINK_LEADER_COMMAND}",
+                command,
+                parameter,
+            )
 
-                elif parameter_type is None:
-                    await getattr(self, f"async_{command}")()
+        # Run the command if leader. The parameter has already been cast above.
+        elif parameter is not None:
+            await getattr(self, f"async_{command}")(parameter)
 
-                return
+        elif parameter_type is None:
+            await getattr(self, f"async_{command}")()
 
     async def async_beolink_set_volume(self, volume_level: str) -> None:
         """Set volume level for all connected Beolink devices."""
@@ -23,10 +23,10 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import HaloConfigEntry, MozartConfigEntry, set_platform_initialized
-from .const import CONNECTION_STATUS, DOMAIN, WebsocketNotification
+from .const import DOMAIN, WebsocketNotification
 from .entity import HaloEntity, MozartEntity
 from .halo import PowerEvent
-from .util import get_remotes, is_halo
+from .util import is_halo
 
 SCAN_INTERVAL = timedelta(minutes=15)
 
@@ -82,9 +82,9 @@ async def _get_mozart_entities(
         )
 
     # Check for connected Beoremote One
-    if remotes := await get_remotes(config_entry.runtime_data.client):
+    if remotes := config_entry.runtime_data.remotes:
         entities.extend(
-            [MozartSensorRemoteBatteryLevel(config_entry, remote) for remote in remotes]
+            MozartSensorRemoteBatteryLevel(config_entry, remote) for remote in remotes
         )
 
     return entities
@@ -109,14 +109,14 @@ class MozartSensorBatteryLevel(MozartSensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.BATTERY}",
+                self._signals[WebsocketNotification.BATTERY],
                 self._update_battery,
             )
         )
@@ -152,7 +152,7 @@ class MozartSensorRemoteBatteryLevel(MozartSensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
@@ -164,11 +164,8 @@ class MozartSensorRemoteBatteryLevel(MozartSensor):
                 _request_timeout=5
             )
 
-            if bool(len(cast(list[PairedRemote], bluetooth_remote_list.items))):
-                remote: PairedRemote = cast(
-                    list[PairedRemote], bluetooth_remote_list.items
-                )[0]
-                self._attr_native_value = remote.battery_level
+            if remotes := bluetooth_remote_list.items:
+                self._attr_native_value = remotes[0].battery_level
 
 
 class MozartSensorBatteryChargingTime(MozartSensor):
@@ -191,14 +188,14 @@ class MozartSensorBatteryChargingTime(MozartSensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.BATTERY}",
+                self._signals[WebsocketNotification.BATTERY],
                 self._update_battery,
             )
         )
@@ -239,14 +236,14 @@ class MozartSensorBatteryPlayingTime(MozartSensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.BATTERY}",
+                self._signals[WebsocketNotification.BATTERY],
                 self._update_battery,
             )
         )
@@ -287,14 +284,14 @@ class MozartSensorMediaId(MozartSensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.PLAYBACK_METADATA}",
+                self._signals[WebsocketNotification.PLAYBACK_METADATA],
                 self._update_playback_metadata,
             )
         )
@@ -324,14 +321,14 @@ class MozartSensorInputSignal(MozartSensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.PLAYBACK_METADATA}",
+                self._signals[WebsocketNotification.PLAYBACK_METADATA],
                 self._update_playback_metadata,
             )
         )
@@ -395,14 +392,14 @@ class HaloSensorBatteryLevel(HaloSensor):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.HALO_POWER}",
+                self._signals[WebsocketNotification.HALO_POWER],
                 self._update_battery,
             )
         )
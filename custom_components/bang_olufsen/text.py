@@ -11,7 +11,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import MozartConfigEntry, set_platform_initialized
-from .const import CONNECTION_STATUS, MODEL_SUPPORT_HOME_CONTROL, MODEL_SUPPORT_MAP
+from .const import MODEL_SUPPORT_HOME_CONTROL, MODEL_SUPPORT_MAP
 from .entity import MozartEntity
 
 
@@ -59,7 +59,7 @@ class BangOlufsenTextHomeControlUri(BangOlufsenText):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{self._unique_id}_{CONNECTION_STATUS}",
+                self._connection_signal,
                 self._async_update_connection_state,
             )
         )
@@ -2,20 +2,35 @@
 
 from __future__ import annotations
 
-from typing import cast
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+from functools import cache
+from typing import Any, cast
 
+from aiohttp import ClientError
+from mozart_api.exceptions import ApiException
 from mozart_api.models import PairedRemote
 from mozart_api.mozart_client import MozartClient
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_MODEL
+from homeassistant.core import callback
 
-from .const import MOZART_MODELS, BangOlufsenModel
+from .const import MOZART_MODELS, BangOlufsenModel, WebsocketNotification
 
 
 def get_serial_number_from_jid(jid: str) -> str:
     """Get serial number from Beolink JID."""
-    return jid.split(".")[2].split("@")[0]
+    return jid.split("@", 1)[0].rsplit(".", 1)[-1]
+
+
+@cache
+def get_signals(unique_id: str) -> dict[WebsocketNotification, str]:
+    """Get the WebSocket notification dispatcher signals for a device."""
+    return {
+        notification: f"{unique_id}_{notification}"
+        for notification in WebsocketNotification
+    }
 
 
 def is_halo(config_entry: ConfigEntry) -> bool:
@@ -46,3 +61,80 @@ async def get_remotes(client: MozartClient) -> list[PairedRemote]:
         for remote in cast(list[PairedRemote], bluetooth_remote_list.items)
         if remote.serial_number is not None
     ]
+
+
+class CoalescedRequests:
+    """Send only the latest requested value while a request is in flight.
+
+    The requests are sent by a background task, so cancelling a caller does not drop pending values.
+    Callers whose value is replaced while waiting get the result of the request that replaced it.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[int], Awaitable[Any]],
+        create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task[None]],
+    ) -> None:
+        """Initialize the request coalescer."""
+        self._send = send
+        self._create_task = create_task
+        self._value = 0
+        self._waiters: list[asyncio.Future[None]] = []
+        self._task: asyncio.Task[None] | None = None
+
+    async def async_send(self, value: int) -> None:
+        """Request a value to be sent and wait for the request that sends it."""
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._value = value
+        self._waiters.append(waiter)
+
+        # A running task sends the latest value once its current request has finished
+        if self._task is None or self._task.done():
+            self._task = self._create_task(self._async_send_pending())
+
+        # Only stop waiting if this caller is cancelled, the value is still sent
+        await asyncio.shield(waiter)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending pending values."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _async_send_pending(self) -> None:
+        """Keep sending the latest value until no values are pending."""
+        waiters: list[asyncio.Future[None]] = []
+        try:
+            while self._waiters:
+                waiters, self._waiters = self._waiters, []
+
+                try:
+                    await self._send(self._value)
+                except (ApiException, ClientError, TimeoutError) as error:
+                    _set_waiters(waiters, error)
+                except Exception as error:
+                    # Report the unexpected error to the callers before raising it
+                    _set_waiters([*waiters, *self._waiters], error)
+                    raise
+                else:
+                    _set_waiters(waiters, None)
+
+        finally:
+            # Cancel waiters that were not handled if sending was cancelled
+            for waiter in (*waiters, *self._waiters):
+                waiter.cancel()
+            self._waiters = []
+
+
+def _set_waiters(
+    waiters: list[asyncio.Future[None]], error: BaseException | None
+) -> None:
+    """Set the result or exception of request waiters that are still waiting."""
+    for waiter in waiters:
+        if waiter.done():
+            continue
+
+        if error is None:
+            waiter.set_result(None)
+        else:
+            waiter.set_exception(error)
@@ -64,13 +64,14 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.util.enum import try_parse_enum
 
 from .const import (
+    BEOLINK_NOTIFICATIONS,
     CONF_ENTITY_MAP,
     CONF_HALO,
-    CONNECTION_STATUS,
     EVENT_TRANSLATION_MAP,
     HALO_WEBSOCKET_EVENT,
     HALO_WHEEL_TIMEOUT,
     MOZART_WEBSOCKET_EVENT,
+    PROXIMITY_NOTIFICATIONS,
     BangOlufsenModel,
     WebsocketNotification,
 )
@@ -684,7 +685,7 @@ class HaloWebsocket(HaloBase):
         """Update all entities of the connection status."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{CONNECTION_STATUS}",
+            self._connection_signal,
             self._client.websocket_connected,
         )
 
@@ -721,7 +722,7 @@ class HaloWebsocket(HaloBase):
         """Send halo_power dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.HALO_POWER}",
+            self._signals[WebsocketNotification.HALO_POWER],
             event,
         )
 
@@ -729,16 +730,17 @@ class HaloWebsocket(HaloBase):
         """Send halo_status dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.HALO_STATUS}",
+            self._signals[WebsocketNotification.HALO_STATUS],
             event,
         )
 
     def on_system_event(self, event: SystemEvent) -> None:
         """Send halo_system dispatch."""
+        # Send the state only, as the event entity triggers the state directly
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.HALO_SYSTEM}",
-            event,
+            self._signals[WebsocketNotification.HALO_SYSTEM],
+            event.state,
         )
 
     async def on_wheel_event(self, event: WheelEvent) -> None:
@@ -819,7 +821,7 @@ class MozartWebsocket(MozartBase):
         """Update all entities of the connection status."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{CONNECTION_STATUS}",
+            self._connection_signal,
             self._client.websocket_connected,
         )
 
@@ -837,7 +839,7 @@ class MozartWebsocket(MozartBase):
         """Send active_listening_mode dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.ACTIVE_LISTENING_MODE}",
+            self._signals[WebsocketNotification.ACTIVE_LISTENING_MODE],
             notification,
         )
 
@@ -845,7 +847,7 @@ class MozartWebsocket(MozartBase):
         """Send active_speaker_group dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.ACTIVE_SPEAKER_GROUP}",
+            self._signals[WebsocketNotification.ACTIVE_SPEAKER_GROUP],
             notification,
         )
 
@@ -853,31 +855,32 @@ class MozartWebsocket(MozartBase):
         """Send battery dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.BATTERY}",
+            self._signals[WebsocketNotification.BATTERY],
             notification,
         )
 
     def on_beo_remote_button_notification(self, notification: BeoRemoteButton) -> None:
-        """Send beo_remote_button dispatch."""
+        """Send beo_remote_button event to the key entities."""
         if TYPE_CHECKING:
             assert notification.type
+            assert notification.key
 
-        # Send to event entity
-        async_dispatcher_send(
-            self.hass,
-            f"{self._unique_id}_{WebsocketNotification.BEO_REMOTE_BUTTON}_{notification.key}",
-            EVENT_TRANSLATION_MAP[notification.type],
-        )
+        # Send to event entities directly instead of through a dispatcher signal per key
+        for key_entity in self.entry.runtime_data.remote_key_entities.get(
+            notification.key, ()
+        ):
+            key_entity.async_handle_event(EVENT_TRANSLATION_MAP[notification.type])
 
     def on_button_notification(self, notification: ButtonEvent) -> None:
-        """Send button dispatch."""
+        """Send button event to the button entity."""
         assert notification.state
-        # Send to event entity
-        async_dispatcher_send(
-            self.hass,
-            f"{self._unique_id}_{WebsocketNotification.BUTTON}_{notification.button}",
-            EVENT_TRANSLATION_MAP[notification.state],
-        )
+        assert notification.button
+
+        # Send to event entity directly instead of through a dispatcher signal per button
+        if button_entity := self.entry.runtime_data.button_entities.get(
+            notification.button
+        ):
+            button_entity.async_handle_event(EVENT_TRANSLATION_MAP[notification.state])
 
     async def on_notification_notification(
         self, notification: WebsocketNotificationTag
@@ -888,27 +891,20 @@ class MozartWebsocket(MozartBase):
         # Try to match the notification type with available WebsocketNotification members
         notification_type = try_parse_enum(WebsocketNotification, notification.value)
 
-        if notification_type in (
-            WebsocketNotification.BEOLINK_PEERS,
-            WebsocketNotification.BEOLINK_LISTENERS,
-            WebsocketNotification.BEOLINK_AVAILABLE_LISTENERS,
-        ):
+        if notification_type in BEOLINK_NOTIFICATIONS:
             async_dispatcher_send(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.BEOLINK}",
+                self._signals[WebsocketNotification.BEOLINK],
             )
         elif notification_type is WebsocketNotification.CONFIGURATION:
             async_dispatcher_send(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.CONFIGURATION}",
+                self._signals[WebsocketNotification.CONFIGURATION],
             )
-        elif notification_type in (
-            WebsocketNotification.PROXIMITY_PRESENCE_DETECTED,
-            WebsocketNotification.PROXIMITY_PRESENCE_NOT_DETECTED,
-        ):
+        elif notification_type in PROXIMITY_NOTIFICATIONS:
             async_dispatcher_send(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.PROXIMITY}",
+                self._signals[WebsocketNotification.PROXIMITY],
                 EVENT_TRANSLATION_MAP[notification.value],
             )
         # This notification is triggered by a remote pairing, unpairing and connecting to a device
@@ -945,14 +941,14 @@ class MozartWebsocket(MozartBase):
         elif notification_type is WebsocketNotification.REMOTE_MENU_CHANGED:
             async_dispatcher_send(
                 self.hass,
-                f"{self._unique_id}_{WebsocketNotification.REMOTE_MENU_CHANGED}",
+                self._signals[WebsocketNotification.REMOTE_MENU_CHANGED],
             )
 
     def on_playback_error_notification(self, notification: PlaybackError) -> None:
         """Send playback_error dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.PLAYBACK_ERROR}",
+            self._signals[WebsocketNotification.PLAYBACK_ERROR],
             notification,
         )
 
@@ -962,7 +958,7 @@ class MozartWebsocket(MozartBase):
         """Send playback_metadata dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.PLAYBACK_METADATA}",
+            self._signals[WebsocketNotification.PLAYBACK_METADATA],
             notification,
         )
 
@@ -970,7 +966,7 @@ class MozartWebsocket(MozartBase):
         """Send playback_progress dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.PLAYBACK_PROGRESS}",
+            self._signals[WebsocketNotification.PLAYBACK_PROGRESS],
             notification,
         )
 
@@ -978,7 +974,7 @@ class MozartWebsocket(MozartBase):
         """Send playback_source dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.PLAYBACK_SOURCE}",
+            self._signals[WebsocketNotification.PLAYBACK_SOURCE],
             notification,
         )
 
@@ -986,7 +982,7 @@ class MozartWebsocket(MozartBase):
         """Send playback_state dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.PLAYBACK_STATE}",
+            self._signals[WebsocketNotification.PLAYBACK_STATE],
             notification,
         )
 
@@ -994,7 +990,7 @@ class MozartWebsocket(MozartBase):
         """Send source_change dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.SOURCE_CHANGE}",
+            self._signals[WebsocketNotification.SOURCE_CHANGE],
             notification,
         )
 
@@ -1002,7 +998,7 @@ class MozartWebsocket(MozartBase):
         """Send volume dispatch."""
         async_dispatcher_send(
             self.hass,
-            f"{self._unique_id}_{WebsocketNotification.VOLUME}",
+            self._signals[WebsocketNotification.VOLUME],
             notification,
         )
 
@@ -0,0 +1,36 @@
+"""Test the Bang & Olufsen utilities."""
+
+import asyncio
+
+from custom_components.bang_olufsen.util import CoalescedRequests
+
+
+def test_coalesced_requests_sender_cancelled() -> None:
+    """Test that cancelling the sending caller does not affect the other callers."""
+
+    async def _test() -> None:
+        sent: list[int] = []
+        request_started = asyncio.Event()
+
+        async def send(value: int) -> None:
+            request_started.set()
+            await asyncio.sleep(0.01)
+            sent.append(value)
+
+        requests = CoalescedRequests(send, asyncio.get_running_loop().create_task)
+
+        # Start a request and queue two more values while it is in flight
+        sender = asyncio.create_task(requests.async_send(1))
+        await request_started.wait()
+        waiters = [asyncio.create_task(requests.async_send(value)) for value in (2, 3)]
+        await asyncio.sleep(0)
+
+        sender.cancel()
+
+        await asyncio.gather(*waiters)
+
+        assert sender.cancelled()
+        # The replaced value is skipped and the latest value is still sent
+        assert sent == [1, 3]
+
+    asyncio.run(_test())